@@ -3,21 +3,22 @@ import time
 import random
 import csv
 import sys
-import copy
 import os
+import concurrent.futures
 
 def print_grid(grid):
     """Print the Sudoku grid in a readable format."""
-    for row in grid:
-        print(" ".join(str(num) if num != 0 else '.' for num in row))
+    for i in range(0, 81, 9):
+        print(" ".join(str(num) if num != 0 else '.' for num in grid[i:i+9]))
 
 def parse_grid_input():
     """
     Prompt user to  9 rows of Sudoku, each 9 chars (digits or '.') 
-    and return a 9x9 grid as list of lists of ints (0 for blanks).
+    and return the grid as a flat bytearray of 81 cells in row-major
+    order, so cell (r,c) is grid[r*9+c] (0 for blanks).
     """
     print("Enter the Sudoku puzzle row by row (use digits 1-9, and . for empty):")
-    grid = []
+    grid = bytearray()
     for i in range(9):
         while True:
             line = input(f"Row {i+1}: ").strip()
@@ -26,198 +27,410 @@ def parse_grid_input():
             if len(line) == 9 and all(c.isdigit() or c == '.' for c in line):
                 break
             print("Invalid format. Enter exactly 9 characters (digits or .).")
-        row = [(int(c) if c.isdigit() else 0) for c in line]
-        grid.append(row)
+        grid.extend(int(c) if c.isdigit() else 0 for c in line)
     return grid
 
+# Bitmask with bits 1..9 set: every digit is still a candidate
+ALL_DIGITS = 0x3FE
+
+# Cells are flat indices 0..80: cell (r,c) is r*9+c
+
+# BOX[i] is the box number 3*(r//3) + c//3 of cell i
+BOX = [3*(i//27) + (i%9)//3 for i in range(81)]
+
+def _peers(i):
+    """Return the 20 cells sharing a row, column or box with cell i."""
+    r, c = divmod(i, 9)
+    peers = {j for j in range(81)
+             if j//9 == r or j%9 == c or BOX[j] == BOX[i]}
+    peers.discard(i)
+    return tuple(sorted(peers))
+
+# PEERS[i] is the static tuple of neighbours of cell i
+PEERS = [_peers(i) for i in range(81)]
+
+# UNITS holds the 27 rows, columns and boxes as tuples of cells
+UNITS = ([tuple(r*9 + c for c in range(9)) for r in range(9)] +
+         [tuple(r*9 + c for r in range(9)) for c in range(9)] +
+         [tuple(i for i in range(81) if BOX[i] == b) for b in range(9)])
+
+# CELL_UNITS[i] holds the UNITS indices of the row, column and box of cell i
+CELL_UNITS = [(i//9, 9 + i%9, 18 + BOX[i]) for i in range(81)]
+
+def unit_masks(grid):
+    """
+    Return (row_mask, col_mask, box_mask): for each row, column and box,
+    a bitmask of the digits already placed in it. Boxes are numbered
+    as in BOX. Built in a single pass over the grid.
+    """
+    row_mask = [0]*9
+    col_mask = [0]*9
+    box_mask = [0]*9
+    for i, v in enumerate(grid):
+        if v:
+            bit = 1 << v
+            row_mask[i//9] |= bit
+            col_mask[i%9] |= bit
+            box_mask[BOX[i]] |= bit
+    return row_mask, col_mask, box_mask
+
 def get_empty_domains(grid):
     """
     Compute initial domains for all empty cells in the grid.
-    Domains[(r,c)] is the set of possible digits for cell (r,c).
+    Domains[i] is a bitmask of possible digits for cell i:
+    bit n is set when digit n is still a candidate.
     """
     global domains
+    row_mask, col_mask, box_mask = unit_masks(grid)
     domains = {}
-    for r in range(9):
-        for c in range(9):
-            if grid[r][c] == 0:
-                # Candidate values 1-9 minus those in same row, col, box
-                used = set(grid[r])  # in row
-                used |= {grid[i][c] for i in range(9)}  # in column
-                br, bc = 3*(r//3), 3*(c//3)
-                for i in range(br, br+3):
-                    for j in range(bc, bc+3):
-                        used.add(grid[i][j])
-                domains[(r,c)] = {n for n in range(1,10) if n not in used}
+    for i, v in enumerate(grid):
+        if v == 0:
+            # Candidate values 1-9 minus those in same row, col, box
+            used = row_mask[i//9] | col_mask[i%9] | box_mask[BOX[i]]
+            domains[i] = ALL_DIGITS & ~used
     return domains
 
-def forward_check(domains, var, value):
+def popcount_buckets(domains):
+    """
+    Group the cells of 'domains' by candidate count: by_pc[k] is the set of
+    cells with exactly k candidates left, so MRV is a scan of 10 buckets.
+    """
+    by_pc = [set() for _ in range(10)]
+    for cell, m in domains.items():
+        by_pc[m.bit_count()].add(cell)
+    return by_pc
+
+def pick_mrv(by_pc):
+    """Return a cell with the fewest candidates from the buckets."""
+    for bucket in by_pc:
+        if bucket:
+            return next(iter(bucket))
+
+def forward_check(domains, var, value, trail, by_pc):
     """
     Apply forward checking: after assigning 'value' to cell 'var', remove
-    that value from the domains of all neighbors of 'var'. Return False if
-    any domain becomes empty (conflict), else True.
+    that value from the domains of all neighbors of 'var'. Every changed
+    domain is recorded on 'trail' as (cell, old_mask) so it can be undone,
+    and moved to its new popcount bucket in 'by_pc'.
+    Return False if any domain becomes empty (conflict), else True.
     """
-    r, c = var
-    peers = []
-    # Row and column peers
-    for i in range(9):
-        if i != c and (r,i) in domains:
-            peers.append((r,i))
-        if i != r and (i,c) in domains:
-            peers.append((i,c))
-    # Box peers
-    br, bc = 3*(r//3), 3*(c//3)
-    for i in range(br, br+3):
-        for j in range(bc, bc+3):
-            if (i,j) != (r,c) and (i,j) in domains:
-                peers.append((i,j))
+    bit = 1 << value
     # Remove the assigned value from neighbors' domains
-    for peer in peers:
-        if value in domains.get(peer, {}):
-            domains[peer].remove(value)
-            if not domains[peer]:
-                return False  # domain wiped out -> failure
+    for peer in PEERS[var]:
+        m = domains.get(peer)
+        # Skip assigned peers and, the common case, peers without the value
+        if m is None or not m & bit:
+            continue
+        nm = m ^ bit  # bit is set in m, so this clears it
+        trail.append((peer, m))
+        domains[peer] = nm
+        k = m.bit_count()
+        by_pc[k].discard(peer)
+        by_pc[k - 1].add(peer)
+        if nm == 0:
+            return False  # domain wiped out -> failure
     return True
 
+def propagate(domains, trail, by_pc, var=None, start=0):
+    """
+    Shrink the domains to a fixpoint before branching, recording every
+    change on 'trail'. Three rules are applied until nothing changes:
+    - a cell narrowed to one candidate removes it from all its peers
+    - a digit that fits only one cell of a unit is fixed there (only choice)
+    - two cells of a unit with the same two candidates remove both digits
+      from the rest of that unit (naked twins)
+    Changed cells are kept in their popcount bucket in 'by_pc'.
+    Only cells changed on the trail after position 'start' and the units
+    of the just-assigned 'var' are revisited; with var=None every unit is
+    scanned. Return False if a conflict is found, else True.
+    """
+    if var is None:
+        dirty = set(range(len(UNITS)))
+    else:
+        dirty = set(CELL_UNITS[var])
+    done = set()  # singles already forward checked in this call
+    i = j = start
+    while True:
+        # Singles: the trail doubles as the worklist of narrowed cells
+        while i < len(trail):
+            cell = trail[i][0]
+            i += 1
+            m = domains.get(cell)
+            if m is None or m & (m - 1) or cell in done:
+                continue
+            if m == 0:
+                return False
+            done.add(cell)
+            if not forward_check(domains, cell, m.bit_length() - 1, trail,
+                                 by_pc):
+                return False
+        # Collect the units touched since the last scan
+        for cell, _ in trail[j:]:
+            dirty.update(CELL_UNITS[cell])
+        j = len(trail)
+        if not dirty:
+            return True
+        for u in dirty:
+            unit = UNITS[u]
+            cells = [cell for cell in unit if cell in domains]
+            if len(cells) < 2:
+                continue
+            # Only choice: digits seen exactly once among the unit's domains
+            once = more = 0
+            for cell in cells:
+                m = domains[cell]
+                more |= once & m
+                once |= m
+            only = once & ~more
+            if only:
+                for cell in cells:
+                    m = domains[cell]
+                    hit = m & only
+                    if not hit:
+                        continue
+                    if hit & (hit - 1):
+                        return False  # two digits need this same cell
+                    if m != hit:
+                        trail.append((cell, m))
+                        domains[cell] = hit
+                        by_pc[m.bit_count()].discard(cell)
+                        by_pc[1].add(cell)
+            # Naked twins: identical two-candidate masks in one unit
+            pairs = {}
+            for cell in cells:
+                m = domains[cell]
+                if m.bit_count() != 2:
+                    continue
+                if m not in pairs:
+                    pairs[m] = cell
+                    continue
+                for other in cells:
+                    if other == cell or other == pairs[m]:
+                        continue
+                    om = domains[other]
+                    if om & m:
+                        nm = om & ~m
+                        trail.append((other, om))
+                        domains[other] = nm
+                        by_pc[om.bit_count()].discard(other)
+                        by_pc[nm.bit_count()].add(other)
+                        if not nm:
+                            return False
+        dirty.clear()
+
+def undo_trail(domains, trail, mark, by_pc):
+    """Restore every domain recorded on 'trail' after position 'mark'."""
+    while len(trail) > mark:
+        cell, old_mask = trail.pop()
+        by_pc[domains[cell].bit_count()].discard(cell)
+        by_pc[old_mask.bit_count()].add(cell)
+        domains[cell] = old_mask
+
 def solve_sudoku(grid):
     """
-    Solve the Sudoku puzzle using backtracking with MRV and forward-checking.
+    Solve the Sudoku puzzle using backtracking with MRV, forward-checking
+    and constraint propagation (only choice, naked twins).
+    The search runs on an explicit stack rather than by recursion.
     Returns (solved_grid, steps) or (None, steps) if unsolvable.
     """
     domains = get_empty_domains(grid)
-    # Global step counter (wrapped in a list to allow modification in nested scope)
-    steps = [0]
-
-    def backtrack():
-        steps[0] += 1  # count this recursive call
-        # If no unassigned vars, puzzle solved
-        nonlocal domains
-        if not domains:
-            return True
-        # MRV heuristic: pick the cell with fewest legal values
-        var = min(domains, key=lambda v: len(domains[v]))
-        choices = domains[var].copy()
-        # If any domain is empty, backtrack
-        if not choices:
-            return False
-        # Save and remove var from domains (we'll re-add on backtrack if needed)
-        saved_domains = domains.copy()
-        del domains[var]
-        r, c = var
-        for val in choices:
-            # Assign value
-            original_row, original_col = grid[r][c], grid[r][c]
-            grid[r][c] = val
-            # Make a deep copy of domains for this branch
-            new_domains = copy.deepcopy(domains)
-            # Forward check: prune neighbors' domains
-            if forward_check(new_domains, var, val):
-                # Continue with pruned domains
-                domains_backup = domains
-                domains = new_domains
-                if backtrack():#recursive call
-                    return True
-                domains = domains_backup
-            # Undo assignment on failure
-            grid[r][c] = 0
-            # Restore domains from before trying this value
-            domains = saved_domains.copy()
-            del domains[var]  # var is still unassigned for next try
-        # No value worked, put var back into domains and fail
-        grid[r][c] = 0
-        domains.clear()
-        domains.update(saved_domains)
-        return False
+    trail = []
+    # Search stack of [var, domain mask, untried bits, trail mark] frames
+    stack = []
+    steps = 0
+    # Bind helpers to locals so the search loop avoids global lookups
+    by_pc = popcount_buckets(domains)
+    check, undo, prop, pick = forward_check, undo_trail, propagate, pick_mrv
 
-    # Start the search
-    success = backtrack()
-    return (grid if success else None, steps[0])
+    descend = prop(domains, trail, by_pc)
+    while True:
+        if descend:
+            steps += 1  # count this search node
+            # If no unassigned vars, puzzle solved
+            if not domains:
+                return (grid, steps)
+            # MRV heuristic: pick the cell with fewest legal values
+            var = pick(by_pc)
+            mask = domains[var]
+            # An empty domain fails at once; otherwise branch on var
+            if mask:
+                del domains[var]
+                by_pc[mask.bit_count()].discard(var)
+                stack.append([var, mask, mask, len(trail)])
+        # Try the next value of the deepest cell, backtracking as needed
+        descend = False
+        while stack and not descend:
+            frame = stack[-1]
+            var, mask, bits, mark = frame
+            # Undo the pruning caused by the previous value
+            undo(domains, trail, mark, by_pc)
+            if not bits:
+                # No value worked, put var back into domains
+                grid[var] = 0
+                domains[var] = mask
+                by_pc[mask.bit_count()].add(var)
+                stack.pop()
+                continue
+            # Take the lowest remaining candidate bit
+            b = bits & -bits
+            frame[2] = bits ^ b
+            val = b.bit_length() - 1
+            grid[var] = val
+            # Forward check and propagate to prune domains before descending
+            descend = (check(domains, var, val, trail, by_pc)
+                       and prop(domains, trail, by_pc, var, mark))
+        if not descend:
+            return (None, steps)
 
-def count_solutions(grid, limit=2):
+def count_solutions(grid, limit=2, domains=None):
     """
     Count up to 'limit' solutions of the Sudoku. Uses a simple backtracking.
     Stop early if count reaches limit. Return number of solutions found (<= limit).
+    Every cell the search fills is cleared again, so 'grid' is left as given.
+    Pre-restricted 'domains' may be passed in place of the grid's own; they
+    are used up by the search.
     """
-    count = [0]
-    domains = get_empty_domains(grid)
+    count = 0
+    if domains is None:
+        domains = get_empty_domains(grid)
+    trail = []
+    stack = []
+    by_pc = popcount_buckets(domains)
+    check, undo, prop, pick = forward_check, undo_trail, propagate, pick_mrv
 
-    def backtrack():
-        # If already found enough solutions, stop
-        nonlocal domains
-        if count[0] >= limit:
-            return True
-        if not domains:
-            count[0] += 1
-            return False  # found one solution; continue to find more
-        var = min(domains, key=lambda v: len(domains[v]))
-        choices = domains[var].copy()
-        if not choices:
-            return False
-        saved_domains = domains.copy()
-        del domains[var]
-        r, c = var
-        for val in choices:
-            grid[r][c] = val
-            new_domains = copy.deepcopy(domains)
-            if forward_check(new_domains, var, val):
-                domains_backup = domains
-                domains = new_domains
-                stop = backtrack()
-                domains = domains_backup
-                if stop:
-                    grid[r][c] = 0
-                    domains.clear()
-                    domains.update(saved_domains)
-                    return True  # reached limit
-            grid[r][c] = 0
-            if count[0] >= limit:
-                domains.clear()
-                domains.update(saved_domains)
-                return True
-        # restore
-        domains.clear()
-        domains.update(saved_domains)
-        grid[r][c] = 0
-        return False
+    descend = prop(domains, trail, by_pc)
+    try:
+        while True:
+            if descend:
+                if not domains:
+                    count += 1  # found one solution; continue to find more
+                    if count >= limit:
+                        return count  # reached limit: stop the search here
+                else:
+                    var = pick(by_pc)
+                    mask = domains[var]
+                    if mask:
+                        del domains[var]
+                        by_pc[mask.bit_count()].discard(var)
+                        stack.append([var, mask, mask, len(trail)])
+            descend = False
+            while stack and not descend:
+                frame = stack[-1]
+                var, mask, bits, mark = frame
+                undo(domains, trail, mark, by_pc)
+                if not bits:
+                    # restore
+                    grid[var] = 0
+                    domains[var] = mask
+                    by_pc[mask.bit_count()].add(var)
+                    stack.pop()
+                    continue
+                b = bits & -bits
+                frame[2] = bits ^ b
+                val = b.bit_length() - 1
+                grid[var] = val
+                descend = (check(domains, var, val, trail, by_pc)
+                           and prop(domains, trail, by_pc, var, mark))
+            if not descend:
+                return count
+    finally:
+        # Clear the cells still assigned on an early stop; the domains and
+        # the trail are discarded, so they are not unwound
+        for frame in stack:
+            grid[frame[0]] = 0
 
-    backtrack()
-    return count[0]
+def has_alternative(grid, i, forbidden):
+    """
+    Return True if the puzzle can be completed with cell i holding any
+    value other than 'forbidden'. Used after removing a clue from a puzzle
+    whose unique solution is known: the puzzle stays unique exactly when
+    no such completion exists.
+    """
+    domains = get_empty_domains(grid)
+    domains[i] &= ~(1 << forbidden)
+    if not domains[i]:
+        return False  # the removed clue is the only digit that fits
+    return count_solutions(grid, limit=1, domains=domains) > 0
 
 def generate_full_solution(grid):
     """
     Fill the grid completely with a valid Sudoku solution using backtracking
-    with random value ordering.
-    Uses recursion to fill the grid.
+    with MRV and random value ordering.
+    Uses an explicit stack instead of recursion to fill the grid.
     """
-    for r in range(9):
-        for c in range(9):
-            if grid[r][c] == 0:
-                random_vals = list(range(1,10))
-                random.shuffle(random_vals)
-                for val in random_vals:
-                    # Check if valid to place
-                    block_vals = {grid[i][j] 
-                                  for i in range(3*(r//3),3*(r//3)+3)
-                                  for j in range(3*(c//3),3*(c//3)+3)}
-                    if (val not in grid[r] and
-                        all(grid[i][c] != val for i in range(9)) and
-                        val not in block_vals):
-                        grid[r][c] = val
-                        if generate_full_solution(grid):
-                            return True
-                        grid[r][c] = 0
-                return False
-    return True
+    row_mask, col_mask, box_mask = unit_masks(grid)
+    empties = [i for i in range(81) if grid[i] == 0]
+
+    def free(cell):
+        used = row_mask[cell//9] | col_mask[cell%9] | box_mask[BOX[cell]]
+        return ALL_DIGITS & ~used
 
-def generate_sudoku(difficulty):
+    # Search stack of [cell, shuffled untried digit bits] frames
+    stack = []
+    descend = True
+    while True:
+        if descend:
+            if not empties:
+                return True
+            # MRV: take the empty cell with the fewest legal digits
+            k = min(range(len(empties)), key=lambda i: free(empties[i]).bit_count())
+            empties[k], empties[-1] = empties[-1], empties[k]
+            cell = empties.pop()
+            bits = free(cell)
+            random_vals = []
+            while bits:
+                b = bits & -bits
+                random_vals.append(b)
+                bits ^= b
+            random.shuffle(random_vals)
+            stack.append([cell, random_vals])
+        descend = False
+        while stack and not descend:
+            cell, random_vals = stack[-1]
+            r, c = divmod(cell, 9)
+            b3 = BOX[cell]
+            # Take back the digit tried last at this cell
+            if grid[cell]:
+                bit = 1 << grid[cell]
+                row_mask[r] ^= bit
+                col_mask[c] ^= bit
+                box_mask[b3] ^= bit
+            if not random_vals:
+                grid[cell] = 0
+                empties.append(cell)
+                stack.pop()
+                continue
+            bit = random_vals.pop()
+            grid[cell] = bit.bit_length() - 1
+            row_mask[r] |= bit
+            col_mask[c] |= bit
+            box_mask[b3] |= bit
+            descend = True
+        if not descend:
+            return False
+
+def _removal_has_alternative(base, i):
+    """
+    Process pool job for generate_sudoku: return True if removing clue i
+    from the grid 'base' (bytes) would leave more than one solution.
+    """
+    grid = bytearray(base)
+    backup = grid[i]
+    grid[i] = 0
+    return has_alternative(grid, i, backup)
+
+def generate_sudoku(difficulty, workers=None):
     """
     Generate a Sudoku puzzle at the given difficulty ('easy', 'medium', 'hard').
+    With 'workers' > 1, uniqueness checks for a batch of candidate clues are
+    run in parallel in a process pool; the result is the same as serially.
     Returns the puzzle grid (0 for blanks).
     """
     # 1. Generate a complete grid
-    grid = [[0]*9 for _ in range(9)]
+    grid = bytearray(81)
     generate_full_solution(grid)
     # 2. Remove clues while maintaining unique solution
-    cells = [(r, c) for r in range(9) for c in range(9)]
+    cells = list(range(81))
     random.shuffle(cells)
     # Determine target number of clues by difficulty
     if difficulty == 'easy':
@@ -227,94 +440,143 @@ def generate_sudoku(difficulty):
     else:  # hard
         min_clues = 24
     removed = 0
-    for (r, c) in cells:
-        if sum(1 for i in range(9) for j in range(9) if grid[i][j] != 0) <= min_clues:
-            break
-        backup = grid[r][c]
-        grid[r][c] = 0
-        # Check uniqueness: count solutions up to 2
-        sol_count = count_solutions([row[:] for row in grid], limit=2)
-        if sol_count != 1:
-            # Not unique, restore
-            grid[r][c] = backup
-        else:
-            removed += 1
+    clues = 81
+    # Uniqueness results are not memoised: each cell is checked at most
+    # once per generated puzzle (batch results are reused while still
+    # valid), and the grid it is checked on never recurs, so a cache
+    # keyed on the grid would never hit
+    pool = None
+    if workers and workers > 1:
+        pool = concurrent.futures.ProcessPoolExecutor(workers)
+    try:
+        pos = 0
+        while pos < len(cells) and clues > min_clues:
+            # Batch one cell per worker, but no more than are left to remove
+            k = min(workers, clues - min_clues) if pool else 1
+            batch = cells[pos:pos+k]
+            pos += k
+            if len(batch) > 1:
+                # Check every cell of the batch against the current grid.
+                # Removing more clues only adds solutions, so a cell
+                # rejected here would also be rejected later.
+                base = bytes(grid)
+                alts = list(pool.map(_removal_has_alternative,
+                                     [base]*len(batch), batch))
+            else:
+                alts = [None]  # not checked yet
+            fresh = True  # grid still matches the one the batch saw
+            for i, alt in zip(batch, alts):
+                if clues <= min_clues:
+                    break
+                if alt:
+                    continue  # not unique, leave the clue in place
+                backup = grid[i]
+                grid[i] = 0
+                # Check uniqueness: only a different digit at cell i can give
+                # a second solution, since the rest of the full grid still fits.
+                # A batch result is only reused while no earlier cell of the
+                # batch has been removed.
+                if (alt is None or not fresh) and has_alternative(grid, i, backup):
+                    # Not unique, restore
+                    grid[i] = backup
+                else:
+                    removed += 1
+                    clues -= 1
+                    fresh = False
+    finally:
+        if pool:
+            pool.shutdown()
     return grid
 
+# Folder used for CSV exports when the user leaves the path empty
+DEFAULT_OUTPUT_DIR = os.path.join("Sudoku", "Output")
+
 def export_to_csv(grid, filename):
     """Export the solved grid to a CSV file, one row per line."""
     try:
-        with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-            for row in grid:
-                writer.writerow(row)
+        folder = os.path.dirname(filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(filename, 'w', newline='', buffering=1<<20) as f:
+            csv.writer(f).writerows(grid[i:i+9] for i in range(0, 81, 9))
         print(f"Solution exported to {filename}")
     except Exception as e:
         print(f"Error writing CSV: {e}")
 
+def clear_screen():
+    """
+    Clear an interactive terminal with an ANSI escape rather than spawning
+    a shell for cls/clear. Does nothing when input or output is redirected.
+    """
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.flush()
+
 def main():
-    os.system("cls" if os.name == "nt" else "clear")
-    print("Sudoku - Solver and Generator (MRV + CSP)")
-    choice = input("Type 'solver' to solve a puzzle or 'generator' to create one: ").strip().lower()
-    if choice == 'solver':
-        # Get puzzle input from user
-        #grid is a list containing puzzle
-        grid = parse_grid_input()
-        print("\nSolving the puzzle...")
-        start = time.time()
-        solution, steps = solve_sudoku(grid)
-        elapsed = time.time() - start
-        if solution:
-            print("\nSolved Sudoku:")
-            print_grid(solution)
-            print(f"Solved in {elapsed:.4f} seconds, with {steps} steps.")
-            export = input("Export solution to CSV? (y/n): ").strip().lower()
-            if export == 'y':
-                fname = input("Enter CSV filename (e.g. solution.csv): ").strip()
-                folder = input("Enter directory path (leave empty for current folder): ").strip()
-                if folder:
-                    filepath = os.path.join(folder, fname)
-                else:
-                    folder="Sudoku\Output"
-                    filepath = os.path.join(folder, fname)
-                export_to_csv(solution, filepath)
-        else:
-            print("No solution found for the given puzzle.")
-    elif choice == 'generator':
-        diff = input("Enter difficulty (easy, medium, hard): ").strip().lower()
-        if diff not in ('easy', 'medium', 'hard'):
-            print("Invalid difficulty. Using 'easy' by default.")
-            diff = 'easy'
-        print(f"\nGenerating a {diff} puzzle...")
-        puzzle = generate_sudoku(diff)
-        print("\nGenerated Sudoku (. = blank):")
-        print_grid(puzzle)
-        solve_it = input("Would you like to solve this puzzle? (y/n): ").strip().lower()
-        if solve_it == 'y':
-            print("\nSolving the generated puzzle...")
+    clear_screen()
+    while True:
+        print("Sudoku - Solver and Generator (MRV + CSP)")
+        choice = input("Type 'solver' to solve a puzzle or 'generator' to create one: ").strip().lower()
+        if choice == 'solver':
+            # Get puzzle input from user
+            #grid is a flat bytearray containing puzzle
+            grid = parse_grid_input()
+            print("\nSolving the puzzle...")
             start = time.time()
-            solution, steps = solve_sudoku(puzzle)
+            solution, steps = solve_sudoku(grid)
             elapsed = time.time() - start
             if solution:
-                print("\nSolution:")
+                print("\nSolved Sudoku:")
                 print_grid(solution)
                 print(f"Solved in {elapsed:.4f} seconds, with {steps} steps.")
                 export = input("Export solution to CSV? (y/n): ").strip().lower()
                 if export == 'y':
                     fname = input("Enter CSV filename (e.g. solution.csv): ").strip()
-                    folder = input("Enter directory path (leave empty for output folder): ").strip()
+                    folder = input("Enter directory path (leave empty for current folder): ").strip()
                     if folder:
                         filepath = os.path.join(folder, fname)
                     else:
-                        folder="Sudoku\Output"
+                        folder = DEFAULT_OUTPUT_DIR
                         filepath = os.path.join(folder, fname)
                     export_to_csv(solution, filepath)
             else:
-                print("Unexpected: generated puzzle has no solution!")
-    else:
-        print("Invalid option. Please select a valid option.")
-        input("Press Enter to continue...")
-        main()
+                print("No solution found for the given puzzle.")
+        elif choice == 'generator':
+            diff = input("Enter difficulty (easy, medium, hard): ").strip().lower()
+            if diff not in ('easy', 'medium', 'hard'):
+                print("Invalid difficulty. Using 'easy' by default.")
+                diff = 'easy'
+            print(f"\nGenerating a {diff} puzzle...")
+            puzzle = generate_sudoku(diff)
+            print("\nGenerated Sudoku (. = blank):")
+            print_grid(puzzle)
+            solve_it = input("Would you like to solve this puzzle? (y/n): ").strip().lower()
+            if solve_it == 'y':
+                print("\nSolving the generated puzzle...")
+                start = time.time()
+                solution, steps = solve_sudoku(puzzle)
+                elapsed = time.time() - start
+                if solution:
+                    print("\nSolution:")
+                    print_grid(solution)
+                    print(f"Solved in {elapsed:.4f} seconds, with {steps} steps.")
+                    export = input("Export solution to CSV? (y/n): ").strip().lower()
+                    if export == 'y':
+                        fname = input("Enter CSV filename (e.g. solution.csv): ").strip()
+                        folder = input("Enter directory path (leave empty for output folder): ").strip()
+                        if folder:
+                            filepath = os.path.join(folder, fname)
+                        else:
+                            folder = DEFAULT_OUTPUT_DIR
+                            filepath = os.path.join(folder, fname)
+                        export_to_csv(solution, filepath)
+                else:
+                    print("Unexpected: generated puzzle has no solution!")
+        else:
+            print("Invalid option. Please select a valid option.")
+            input("Press Enter to continue...")
+            continue
+        break
 
 if __name__ == "__main__":
     main()